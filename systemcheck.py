@@ -1,8 +1,16 @@
 import psutil
 import time
+import asyncio
+import atexit
+import argparse
 import os
+import sys
 import datetime
-import math  
+import math
+import functools
+import shutil
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 
 
 try:
@@ -13,6 +21,29 @@ try:
     clr.AddReference("LibreHardwareMonitorLib")
     from LibreHardwareMonitor import Hardware
 
+    # Opening the Computer enumerates hardware and loads drivers, which is far too slow to repeat
+    # on every refresh, so it is opened once here and only Update()d afterwards.
+    lhm_computer = Hardware.Computer()
+    lhm_computer.IsCpuEnabled = True
+    lhm_computer.IsGpuNvidiaEnabled = True  # For NVIDIA GPUs
+    lhm_computer.IsGpuAmdEnabled = True  # For AMD GPUs
+    # You can enable other hardware types if needed:
+    # lhm_computer.IsMemoryEnabled = True
+    # lhm_computer.IsMotherboardEnabled = True
+    # lhm_computer.IsStorageEnabled = True
+    lhm_computer.Open()
+    atexit.register(lhm_computer.Close)
+
+    # The set of temperature sensors is fixed once the Computer is open, so look them up (and their
+    # names, which are marshalled through pythonnet) once: [(hardware_item, group_name, [(label, sensor), ...])]
+    lhm_temp_sensors = []
+    for hardware_item in lhm_computer.Hardware:
+        hardware_item.Update()  # Some sensors are only populated after the first update
+        temp_sensors = [(sensor.Name, sensor) for sensor in hardware_item.Sensors
+                        if sensor.SensorType == Hardware.SensorType.Temperature]
+        if temp_sensors:  # Only keep hardware that has temperature sensors
+            lhm_temp_sensors.append((hardware_item, hardware_item.Name, temp_sensors))
+
     libre_hw_monitor_available = True
     libre_hw_monitor_error = None
 except Exception as e:
@@ -20,51 +51,229 @@ except Exception as e:
     libre_hw_monitor_error = str(e)  # Store the error message
 
 # --- Configuration ---
-UPDATE_INTERVAL = 2  # Seconds
-
-# Auto-detect OS for default disk monitoring (can be overridden manually)
+# Seconds between refreshes; override with --interval or the SYSCHECK_INTERVAL environment variable.
+# Every refresh re-reads all sensors, so shorter intervals give fresher numbers at the cost of more
+# CPU time spent by the monitor itself (and more LHM driver polling on Windows).
+UPDATE_INTERVAL = 2
+
+# Temperatures change slowly and reading them is comparatively expensive (sysfs/LHM drivers),
+# so sensors are re-read at most this often and the last readings are shown in between.
+TEMPERATURE_CACHE_TTL = 5  # Seconds
+
+# Disks to monitor (can be overridden manually or with --disks). None monitors every mounted
+# partition, detected once at startup.
+DISKS_TO_MONITOR = None
+# Example for multiple disks on Windows: DISKS_TO_MONITOR = ['C:\\', 'D:\\']
+# Example for multiple disks on Linux/macOS: DISKS_TO_MONITOR = ['/', '/mnt/data']
+
+# Auto-detect OS for the disk monitored when partition detection finds nothing
 if os.name == 'nt':  # Windows
-    DISKS_TO_MONITOR = ['C:\\']
-    # Example for multiple disks on Windows: DISKS_TO_MONITOR = ['C:\\', 'D:\\']
+    FALLBACK_DISKS = ['C:\\']
 else:  # Linux/macOS
-    DISKS_TO_MONITOR = ['/']
-    # Example for multiple disks on Linux/macOS: DISKS_TO_MONITOR = ['/', '/mnt/data']
+    FALLBACK_DISKS = ['/']
+
+
+def detect_disks():
+    """
+    Returns the mountpoints of all mounted partitions.
+    This parses the whole mount table, so it is done once per run (see --refresh-partitions-every).
+    """
+    try:
+        partitions = psutil.disk_partitions(all=False)
+    except Exception:
+        return FALLBACK_DISKS
+    # Skip drives without a filesystem (e.g. empty optical drives), read-only images mounted through
+    # loop devices (e.g. Ubuntu's /snap/* squashfs mounts, which always report 100% full)
+    # and repeated bind mounts
+    mountpoints = list(dict.fromkeys(
+        p.mountpoint for p in partitions
+        if p.fstype and p.fstype != 'squashfs'
+        and not (p.device.startswith('/dev/loop') and 'ro' in p.opts.split(','))
+    ))
+    return mountpoints or FALLBACK_DISKS
+
+
+# Worker threads for independent blocking reads (disk usage, LHM hardware updates).
+# psutil and LHM release the GIL while waiting on the OS, so these run in parallel.
+io_executor = ThreadPoolExecutor(max_workers=len(DISKS_TO_MONITOR or FALLBACK_DISKS) + 2)
 
 
 # --- Helper Functions ---
+SIZE_UNITS = ("", "K", "M", "G", "T", "P")
+
+
 def get_size_gb(bytes_val, suffix="B"):
     """
     Scale bytes to its proper format e.g:
     1253656 => '1.20MB'
     1253656678 => '1.17GB'
     """
-    factor = 1024
-    for unit in ["", "K", "M", "G", "T", "P"]:
-        if bytes_val < factor:
-            return f"{bytes_val:.2f}{unit}{suffix}"
-        bytes_val /= factor
-    return f"{bytes_val:.2f}P{suffix}"
+    if not math.isfinite(bytes_val):  # int() can't take inf/nan
+        return f"{bytes_val:.2f}{suffix}"
+    # Each unit is 2**10 of the previous one, so the unit index falls out of the bit length
+    unit_idx = min(max(0, (int(bytes_val).bit_length() - 1) // 10), len(SIZE_UNITS) - 1)
+    return f"{bytes_val / (1 << (unit_idx * 10)):.2f}{SIZE_UNITS[unit_idx]}{suffix}"
+
+
+def cached(ttl, cache_if=None):
+    """
+    Decorator that reuses a no-argument function's last result for ttl seconds.
+    If cache_if is given, only results for which cache_if(result) is true are kept.
+    """
+    def decorator(func):
+        entry = None  # (timestamp, value) of the last cached result
+
+        @functools.wraps(func)
+        def wrapper():
+            nonlocal entry
+            now = time.monotonic()
+            if entry is not None and now - entry[0] < ttl:
+                return entry[1]
+            value = func()
+            if cache_if is None or cache_if(value):
+                entry = (now, value)
+            return value
+        return wrapper
+    return decorator
+
+
+# --- Linux /proc Readers ---
+# psutil re-opens and re-parses the same /proc files for every API call (cpu_percent twice,
+# virtual_memory and swap_memory both read /proc/meminfo). On Linux we read each file once
+# per refresh instead; other platforms keep using psutil.
+ON_LINUX = sys.platform.startswith('linux')
+
+MemoryUsage = namedtuple('MemoryUsage', ['total', 'available', 'used', 'free', 'percent'])
+SwapUsage = namedtuple('SwapUsage', ['total', 'used', 'free', 'percent'])
+NetIOCounters = namedtuple('NetIOCounters', ['bytes_sent', 'bytes_recv'])
+
+
+def read_proc_file(path):
+    """Reads a /proc file in a single read() call."""
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+# (total, busy) jiffies per /proc/stat cpu line from the previous call; index 0 is the aggregate
+last_cpu_times = None
+
+
+def get_cpu_usage():
+    """
+    Returns (overall_percent, [per_core_percent, ...]) since the previous call.
+    The first call only establishes a baseline and reports 0.0 everywhere.
+    """
+    global last_cpu_times
+
+    if not ON_LINUX:
+        return psutil.cpu_percent(interval=None), psutil.cpu_percent(interval=None, percpu=True)
+
+    current_cpu_times = []
+    for line in read_proc_file('/proc/stat').split(b'\n'):
+        if not line.startswith(b'cpu'):
+            break  # cpu lines always come first
+        fields = [int(x) for x in line.split()[1:]]
+        # Same accounting as psutil: guest time is already included in user/nice
+        total = sum(fields[:8])
+        busy = total - fields[3] - (fields[4] if len(fields) > 4 else 0)  # minus idle and iowait
+        current_cpu_times.append((total, busy))
+
+    previous_cpu_times = last_cpu_times
+    last_cpu_times = current_cpu_times
+    if previous_cpu_times is None or len(previous_cpu_times) != len(current_cpu_times):
+        return 0.0, [0.0] * (len(current_cpu_times) - 1)
+
+    percents = []
+    for (total, busy), (last_total, last_busy) in zip(current_cpu_times, previous_cpu_times):
+        total_diff = total - last_total
+        if total_diff <= 0:
+            percents.append(0.0)
+        else:
+            percents.append(round(min(max((busy - last_busy) / total_diff * 100, 0.0), 100.0), 1))
+    return percents[0], percents[1:]
+
+
+def get_memory_usage():
+    """Returns (memory, swap) usage, reading /proc/meminfo only once on Linux."""
+    if not ON_LINUX:
+        return psutil.virtual_memory(), psutil.swap_memory()
+
+    meminfo = {}
+    for line in read_proc_file('/proc/meminfo').split(b'\n'):
+        fields = line.split()
+        if len(fields) >= 2:
+            meminfo[fields[0]] = int(fields[1]) * 1024  # Values are in kB
+
+    total = meminfo.get(b'MemTotal:', 0)
+    free = meminfo.get(b'MemFree:', 0)
+    cached = meminfo.get(b'Cached:', 0) + meminfo.get(b'SReclaimable:', 0)
+    available = meminfo.get(b'MemAvailable:', free + cached)
+    used = total - available  # Same as psutil, so "Used" agrees with the percentage
+    mem = MemoryUsage(total, available, used, free, used / total * 100 if total else 0.0)
+
+    swap_total = meminfo.get(b'SwapTotal:', 0)
+    swap_free = meminfo.get(b'SwapFree:', 0)
+    swap_used = swap_total - swap_free
+    swap = SwapUsage(swap_total, swap_used, swap_free,
+                     swap_used / swap_total * 100 if swap_total else 0.0)
+    return mem, swap
+
+
+def get_net_io_counters():
+    """Returns total bytes sent/received across all interfaces."""
+    if not ON_LINUX:
+        return psutil.net_io_counters()
+
+    bytes_sent = bytes_recv = 0
+    for line in read_proc_file('/proc/net/dev').split(b'\n')[2:]:  # Skip the two header lines
+        _, sep, data = line.partition(b':')
+        if not sep:
+            continue
+        fields = data.split()
+        bytes_recv += int(fields[0])
+        bytes_sent += int(fields[8])
+    return NetIOCounters(bytes_sent, bytes_recv)
+
+
+# ANSI escape sequence: move the cursor home and clear the screen
+CLEAR_SCREEN_SEQ = "\x1b[H\x1b[2J"
+
+if os.name == 'nt':
+    # Running an empty command once makes Windows 10+ consoles honour ANSI/VT escape sequences
+    os.system("")
 
 
 def clear_screen():
-    """Clears the terminal screen."""
-    os.system('cls' if os.name == 'nt' else 'clear')
+    """Clears the terminal screen without spawning a shell."""
+    sys.stdout.write(CLEAR_SCREEN_SEQ)
+    sys.stdout.flush()
+
+
+# Totals that don't change while the monitor runs are formatted once
+MEM_TOTAL_STR, SWAP_TOTAL_STR = (get_size_gb(usage.total) for usage in get_memory_usage())
+disk_total_strs = {}  # disk path -> formatted total size, filled the first time each disk is read
 
 
 # Global variables for network speed calculation
-last_net_io = psutil.net_io_counters()
-last_time_net = time.time()
+last_net_io = get_net_io_counters()
+last_time_net = time.monotonic()  # Monotonic so clock adjustments can't skew the speeds
+
+# Samples further apart than this (e.g. after the machine was suspended) are too stale to report a speed.
+# The limit grows with long --interval settings so normal refreshes are never treated as stale.
+MAX_NET_SAMPLE_AGE = 60  # Seconds, at least 3 refresh intervals
 
 
 def get_network_speed():
     """Calculates network upload and download speed."""
     global last_net_io, last_time_net
 
-    current_net_io = psutil.net_io_counters()
-    current_time = time.time()
+    current_net_io = get_net_io_counters()
+    current_time = time.monotonic()
 
     elapsed_time = current_time - last_time_net
-    if elapsed_time == 0:  # Avoid division by zero
+    if elapsed_time <= 0 or elapsed_time > max(MAX_NET_SAMPLE_AGE, UPDATE_INTERVAL * 3):  # Avoid division by zero; reset the baseline
+        last_net_io = current_net_io
+        last_time_net = current_time
         return 0.0, 0.0, current_net_io.bytes_sent, current_net_io.bytes_recv
 
     bytes_sent_diff = current_net_io.bytes_sent - last_net_io.bytes_sent
@@ -79,6 +288,7 @@ def get_network_speed():
     return upload_speed, download_speed, current_net_io.bytes_sent, current_net_io.bytes_recv
 
 
+@cached(ttl=TEMPERATURE_CACHE_TTL, cache_if=lambda result: result[1] is None)  # Retry errors next refresh
 def get_temperatures_lhm():
     """
     Retrieves temperatures using LibreHardwareMonitorLib.
@@ -90,175 +300,273 @@ def get_temperatures_lhm():
         return temps_data, f"LibreHardwareMonitorLib not loaded. Stored error: {libre_hw_monitor_error}"
 
     try:
-        computer = Hardware.Computer()
-        computer.IsCpuEnabled = True
-        computer.IsGpuNvidiaEnabled = True  # For NVIDIA GPUs
-        computer.IsGpuAmdEnabled = True  # For AMD GPUs
-        # You can enable other hardware types if needed:
-        # computer.IsMemoryEnabled = True
-        # computer.IsMotherboardEnabled = True
-        # computer.IsStorageEnabled = True
-        computer.Open()
-
-        for hardware_item in computer.Hardware:
-            hardware_item.Update()  # Update sensors for this specific hardware item
-            group_name = hardware_item.Name
+        # Update all hardware items concurrently; list() re-raises any error from the workers
+        list(io_executor.map(lambda item: item[0].Update(), lhm_temp_sensors))
+        for hardware_item, group_name, temp_sensors in lhm_temp_sensors:
             current_group_temps = []
-            for sensor in hardware_item.Sensors:
-                if sensor.SensorType == Hardware.SensorType.Temperature:
-                    # Ensure sensor.Value is not None before trying to use it
-                    temp_value = sensor.Value if sensor.Value is not None else float('nan')
-                    current_group_temps.append({
-                        "label": sensor.Name,
-                        "current": temp_value
-                    })
-            if current_group_temps:  # Only add group if it has temperature sensors
-                temps_data[group_name] = current_group_temps
-        computer.Close()
+            for label, sensor in temp_sensors:
+                # sensor.Value is None when the sensor has no reading; filtered out when displayed
+                current_group_temps.append({
+                    "label": label,
+                    "current": sensor.Value
+                })
+            temps_data[group_name] = current_group_temps
         return temps_data, None
     except Exception as e:
         return {}, f"Error during LibreHardwareMonitor operation: {e}"
 
 
+def positive_float(value):
+    """argparse type for strictly positive, finite floats."""
+    number = float(value)
+    if not (math.isfinite(number) and number > 0):  # nan would busy-loop, inf would never refresh
+        raise argparse.ArgumentTypeError(f"must be a finite number greater than 0, got {value}")
+    return number
+
+
+def parse_args(argv=None):
+    """Parses command line options, falling back to environment variables and the defaults above."""
+    parser = argparse.ArgumentParser(description="Real-time system performance & temperature monitor.")
+    parser.add_argument(
+        "--interval", type=positive_float,
+        default=os.environ.get("SYSCHECK_INTERVAL", str(UPDATE_INTERVAL)),
+        help="seconds between refreshes (default: $SYSCHECK_INTERVAL or %(default)s). "
+             "Longer intervals use less CPU; shorter ones give fresher readings.")
+    parser.add_argument(
+        "--disks", type=lambda value: [path for path in value.split(",") if path],
+        help="comma-separated disk paths/mountpoints to monitor "
+             "(default: DISKS_TO_MONITOR if set in the script, otherwise all mounted partitions detected at startup)")
+    parser.add_argument(
+        "--refresh-partitions-every", type=int, default=0, metavar="N",
+        help="re-detect mounted partitions every N refreshes when --disks is not given (default: never)")
+    return parser.parse_args(argv)
+
+
+# Line templates for the per-refresh, per-item output, built once and reused every refresh
+CPU_OVERALL_FMT = "  Overall: {:.1f}%"
+CORE_FMT = "  Core {:d}:   {:.1f}%"
+
+# When the per-core lines would not fit in the rows the rest of the frame leaves free,
+# the cores are drawn as one bar per core on a single line instead
+CORE_BLOCKS = "▁▂▃▄▅▆▇█"  # 0-12.5%, 12.5-25%, ..., 87.5-100%
+try:
+    CORE_BLOCKS.encode(sys.stdout.encoding or "ascii")
+    compact_cores_supported = True
+except (UnicodeEncodeError, LookupError):  # e.g. a legacy code page; keep the per-core lines
+    compact_cores_supported = False
+
+
+# Messages that only depend on what was available at startup
+LHM_UNAVAILABLE_LINES = [
+    f"  LibreHardwareMonitorLib not found or failed to load. Error: {libre_hw_monitor_error}",
+    "  (For temperature monitoring on Windows, download 'LibreHardwareMonitorLib.dll' and place it in the script's directory).",
+]
+PSUTIL_NO_SENSORS_LINES = ["  psutil: Temperature sensors not found or not supported on this system."]
+if os.name != 'nt':  # Only show lm-sensors hint for non-Windows
+    PSUTIL_NO_SENSORS_LINES.append("  (On Linux, you might need 'lm-sensors' installed and configured.)")
+
+
+@cached(ttl=TEMPERATURE_CACHE_TTL)
+def read_psutil_temperatures():
+    """Reads temperatures through psutil (parses /sys/class/hwmon on Linux)."""
+    return psutil.sensors_temperatures(fahrenheit=False)
+
+
+async def get_psutil_temperature_lines():
+    """Temperature section lines read through psutil, used when LHM reported nothing."""
+    out = ["\n  Attempting fallback with psutil for temperatures..."]
+    try:
+        psutil_temps_data = await asyncio.to_thread(read_psutil_temperatures)
+        if not psutil_temps_data:
+            out.extend(PSUTIL_NO_SENSORS_LINES)
+        else:
+            psutil_data_found = False
+            for name, entries in psutil_temps_data.items():
+                if not entries: continue
+                out.append(f"  Sensor Group (psutil - {name}):")
+                for entry in entries:
+                    label = f" ({entry.label})" if entry.label else ""
+                    out.append(f"    {entry.current:.1f}°C{label}")
+                    if entry.high:
+                        out.append(f"      High: {entry.high:.1f}°C")
+                    if entry.critical:
+                        out.append(f"      Critical: {entry.critical:.1f}°C")
+                    psutil_data_found = True
+            if not psutil_data_found:
+                out.append(
+                    "  psutil: No specific temperature data available from detected sensors (sensors might be present but not reporting values).")
+    except AttributeError:
+        out.append("  psutil: psutil.sensors_temperatures() not available on this platform/psutil version.")
+    except Exception as e:
+        out.append(f"  psutil: Could not retrieve temperatures: {e}")
+        # print("  (You might need to run the script with administrator/root privileges for some sensors via psutil.)") # Already mentioned by LHM if it fails
+    return out
+
+
+async def display_temps_lhm():
+    """Temperature section lines when LibreHardwareMonitorLib is loaded, falling back to psutil."""
+    out = ["  Attempting to read temperatures using LibreHardwareMonitorLib..."]
+    lhm_reported_temps = False
+    lhm_temps, lhm_error_msg = await asyncio.to_thread(get_temperatures_lhm)
+    if lhm_error_msg:
+        out.append(f"  LibreHardwareMonitor: Failed. Error: {lhm_error_msg}")
+    elif not lhm_temps or not any(lhm_temps.values()):
+        out.append("  LibreHardwareMonitor: No temperature sensors found or no data reported by sensors.")
+    else:
+        data_printed_for_lhm = False
+        for group, entries in lhm_temps.items():
+            if not entries: continue
+            # Filter for entries that actually have a valid temperature reading
+            valid_entries_in_group = [e for e in entries if e['current'] is not None]
+            if not valid_entries_in_group: continue
+
+            out.append(f"  Sensor Group (LHM - {group}):")
+            for entry in valid_entries_in_group:
+                out.append(f"    {entry['label']}: {entry['current']:.1f}°C")
+            data_printed_for_lhm = True
+
+        if data_printed_for_lhm:
+            lhm_reported_temps = True
+        else:
+            out.append("  LibreHardwareMonitor: Sensors might be detected, but no valid temperature values available.")
+
+    if not lhm_reported_temps:
+        out.extend(await get_psutil_temperature_lines())
+    return out
+
+
+async def display_temps_psutil():
+    """Temperature section lines when LibreHardwareMonitorLib is unavailable."""
+    return LHM_UNAVAILABLE_LINES + await get_psutil_temperature_lines()
+
+
+# LHM availability is fixed at startup, so pick the matching temperature reader once
+display_temps = display_temps_lhm if libre_hw_monitor_available else display_temps_psutil
+
+
 # --- Main Monitoring Function ---
-def display_system_stats():
+async def display_system_stats():
     """Gathers and displays system performance and temperature data."""
-    print("System Performance & Temperature Monitor")
-    print("----------------------------------------")
-    print(f"Last updated: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    print("Press Ctrl+C to exit.\n")
+    out = []  # Collect the whole frame and write it in one go to avoid flicker
+    # Start the disk queries now so they run while CPU, memory and network are gathered
+    disk_futures = [(disk_path, asyncio.wrap_future(io_executor.submit(psutil.disk_usage, disk_path)))
+                    for disk_path in DISKS_TO_MONITOR]
+    # The remaining readers block on /proc, psutil or LHM drivers; run them side by side in threads
+    (cpu_overall, cpu_per_core), (mem, swap), network_speed, temperature_lines = await asyncio.gather(
+        asyncio.to_thread(get_cpu_usage),
+        asyncio.to_thread(get_memory_usage),
+        asyncio.to_thread(get_network_speed),
+        display_temps(),
+    )
+
+    out.append("System Performance & Temperature Monitor")
+    out.append("----------------------------------------")
+    out.append(f"Last updated: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    out.append("Press Ctrl+C to exit.\n")
 
     # 1. CPU Usage
-    print("--- CPU Usage ---")
-    # Get per-core usage first. interval=None uses time since last call (or initial call in main)
-    cpu_per_core = psutil.cpu_percent(interval=None, percpu=True)
-    if cpu_per_core:  # Check if list is not empty
-        cpu_overall = sum(cpu_per_core) / len(cpu_per_core)
-        print(f"  Overall: {cpu_overall:.1f}% (avg of cores)")
-    else:  # Fallback if percpu=True returns empty or fails, get a general reading
-        cpu_overall = psutil.cpu_percent(interval=None)
-        print(f"  Overall: {cpu_overall:.1f}%")
-
-    for i, core_usage in enumerate(cpu_per_core):
-        print(f"  Core {i + 1}:   {core_usage:.1f}%")
-    print("")
+    out.append("--- CPU Usage ---")
+    # Usage since the last call (or initial call in main); aggregate and per-core come from one sample
+    out.append(CPU_OVERALL_FMT.format(cpu_overall))
+    if cpu_per_core:
+        core_block_idx = len(out)  # Filled in once the size of the rest of the frame is known
+        out.append(None)
+    out.append("")
 
     # 2. Memory Usage
-    print("--- Memory Usage (RAM) ---")
-    mem = psutil.virtual_memory()
-    print(f"  Total:     {get_size_gb(mem.total)}")
-    print(f"  Available: {get_size_gb(mem.available)}")
-    print(f"  Used:      {get_size_gb(mem.used)} ({mem.percent:.1f}%)")
-    print(f"  Free:      {get_size_gb(mem.free)}")
-    swap = psutil.swap_memory()
-    print(f"  Swap Total: {get_size_gb(swap.total)}")
-    print(f"  Swap Used:  {get_size_gb(swap.used)} ({swap.percent:.1f}%)")
-    print("")
+    out.append("--- Memory Usage (RAM) ---")
+    out.append(f"  Total:     {MEM_TOTAL_STR}")
+    out.append(f"  Available: {get_size_gb(mem.available)}")
+    out.append(f"  Used:      {get_size_gb(mem.used)} ({mem.percent:.1f}%)")
+    out.append(f"  Free:      {get_size_gb(mem.free)}")
+    out.append(f"  Swap Total: {SWAP_TOTAL_STR}")
+    out.append(f"  Swap Used:  {get_size_gb(swap.used)} ({swap.percent:.1f}%)")
+    out.append("")
 
     # 3. Disk Usage
-    print("--- Disk Usage ---")
-    for disk_path in DISKS_TO_MONITOR:
+    out.append("--- Disk Usage ---")
+    for disk_path, disk_future in disk_futures:
         try:
-            disk = psutil.disk_usage(disk_path)
-            print(f"  Disk ({disk_path}):")
-            print(f"    Total:     {get_size_gb(disk.total)}")
-            print(f"    Used:      {get_size_gb(disk.used)} ({disk.percent:.1f}%)")
-            print(f"    Free:      {get_size_gb(disk.free)}")
+            disk = await disk_future
+            out.append(f"  Disk ({disk_path}):")
+            if disk_path not in disk_total_strs:
+                disk_total_strs[disk_path] = get_size_gb(disk.total)
+            out.append(f"    Total:     {disk_total_strs[disk_path]}")
+            out.append(f"    Used:      {get_size_gb(disk.used)} ({disk.percent:.1f}%)")
+            out.append(f"    Free:      {get_size_gb(disk.free)}")
         except FileNotFoundError:
-            print(f"  Disk ({disk_path}): Not found or inaccessible.")
+            out.append(f"  Disk ({disk_path}): Not found or inaccessible.")
         except Exception as e:
-            print(f"  Disk ({disk_path}): Error - {e}")
-    print("")
+            out.append(f"  Disk ({disk_path}): Error - {e}")
+    out.append("")
 
     # 4. Network Activity
-    print("--- Network Activity ---")
-    upload_speed, download_speed, total_sent, total_recv = get_network_speed()
-    print(f"  Total Sent:      {get_size_gb(total_sent)}")
-    print(f"  Total Received:  {get_size_gb(total_recv)}")
-    print(f"  Upload Speed:    {get_size_gb(upload_speed)}/s")
-    print(f"  Download Speed:  {get_size_gb(download_speed)}/s")
-    print("")
+    out.append("--- Network Activity ---")
+    upload_speed, download_speed, total_sent, total_recv = network_speed
+    out.append(f"  Total Sent:      {get_size_gb(total_sent)}")
+    out.append(f"  Total Received:  {get_size_gb(total_recv)}")
+    out.append(f"  Upload Speed:    {get_size_gb(upload_speed)}/s")
+    out.append(f"  Download Speed:  {get_size_gb(download_speed)}/s")
+    out.append("")
 
     # 5. System Temperatures / Heat
-    print("--- System Temperatures ---")
-    lhm_reported_temps = False
-    if libre_hw_monitor_available:
-        print("  Attempting to read temperatures using LibreHardwareMonitorLib...")
-        lhm_temps, lhm_error_msg = get_temperatures_lhm()
-        if lhm_error_msg:
-            print(f"  LibreHardwareMonitor: Failed. Error: {lhm_error_msg}")
-        elif not lhm_temps or not any(lhm_temps.values()):
-            print("  LibreHardwareMonitor: No temperature sensors found or no data reported by sensors.")
-        else:
-            data_printed_for_lhm = False
-            for group, entries in lhm_temps.items():
-                if not entries: continue
-                # Filter for entries that actually have a valid temperature reading
-                valid_entries_in_group = [e for e in entries if
-                                          isinstance(e['current'], float) and not math.isnan(e['current'])]
-                if not valid_entries_in_group: continue
-
-                print(f"  Sensor Group (LHM - {group}):")
-                for entry in valid_entries_in_group:
-                    print(f"    {entry['label']}: {entry['current']:.1f}°C")
-                data_printed_for_lhm = True
-
-            if data_printed_for_lhm:
-                lhm_reported_temps = True
-            else:
-                print("  LibreHardwareMonitor: Sensors might be detected, but no valid temperature values available.")
-    else:
-        print(f"  LibreHardwareMonitorLib not found or failed to load. Error: {libre_hw_monitor_error}")
-        print(
-            "  (For temperature monitoring on Windows, download 'LibreHardwareMonitorLib.dll' and place it in the script's directory).")
-
-    if not lhm_reported_temps:
-        print("\n  Attempting fallback with psutil for temperatures...")
-        try:
-            psutil_temps_data = psutil.sensors_temperatures()
-            if not psutil_temps_data:
-                print("  psutil: Temperature sensors not found or not supported on this system.")
-                if os.name != 'nt':  # Only show lm-sensors hint for non-Windows
-                    print("  (On Linux, you might need 'lm-sensors' installed and configured.)")
-            else:
-                psutil_data_found = False
-                for name, entries in psutil_temps_data.items():
-                    if not entries: continue
-                    print(f"  Sensor Group (psutil - {name}):")
-                    for entry in entries:
-                        label = f" ({entry.label})" if entry.label else ""
-                        print(f"    {entry.current:.1f}°C{label}")
-                        if entry.high:
-                            print(f"      High: {entry.high:.1f}°C")
-                        if entry.critical:
-                            print(f"      Critical: {entry.critical:.1f}°C")
-                        psutil_data_found = True
-                if not psutil_data_found:
-                    print(
-                        "  psutil: No specific temperature data available from detected sensors (sensors might be present but not reporting values).")
-        except AttributeError:
-            print("  psutil: psutil.sensors_temperatures() not available on this platform/psutil version.")
-        except Exception as e:
-            print(f"  psutil: Could not retrieve temperatures: {e}")
-            # print("  (You might need to run the script with administrator/root privileges for some sensors via psutil.)") # Already mentioned by LHM if it fails
+    out.append("--- System Temperatures ---")
+    out.extend(temperature_lines)
 
     # Final check if any temperature was reported by any method
     # This check is implicitly handled by the flow above; if no temps, messages are already printed.
-    print("")
+    out.append("")
+    out.append(f"\nUpdating in {UPDATE_INTERVAL:g} seconds...")
+
+    if cpu_per_core:
+        # Rows used by everything except the core lines, including the line the cursor ends on
+        other_rows = sum(line.count("\n") + 1 for line in out if line is not None) + 1
+        free_rows = shutil.get_terminal_size().lines - other_rows
+        if compact_cores_supported and len(cpu_per_core) > free_rows:
+            out[core_block_idx] = "  Cores:   " + "".join(
+                CORE_BLOCKS[min(7, int(core_usage / 12.5))] for core_usage in cpu_per_core)
+        else:
+            out[core_block_idx] = "\n".join(
+                CORE_FMT.format(i, core_usage) for i, core_usage in enumerate(cpu_per_core, 1))
+
+    sys.stdout.write(CLEAR_SCREEN_SEQ + "\n".join(out) + "\n")
+    sys.stdout.flush()
+
+
+async def monitor(refresh_partitions_every=0):
+    """
+    Refreshes the display every UPDATE_INTERVAL seconds until interrupted.
+    If refresh_partitions_every is set, the auto-detected disk list is rebuilt every that many refreshes.
+    """
+    global DISKS_TO_MONITOR
+
+    refresh_count = 0
+    while True:
+        refresh_count += 1
+        if refresh_partitions_every > 0 and refresh_count % refresh_partitions_every == 0:
+            DISKS_TO_MONITOR = await asyncio.to_thread(detect_disks)
+        await display_system_stats()  # Clears the screen and draws the frame in a single write
+        await asyncio.sleep(UPDATE_INTERVAL)
 
 
 if __name__ == "__main__":
+    args = parse_args()
+    UPDATE_INTERVAL = args.interval
+    auto_detect_disks = DISKS_TO_MONITOR is None and not args.disks
+    if args.disks:
+        DISKS_TO_MONITOR = args.disks
+    elif auto_detect_disks:
+        DISKS_TO_MONITOR = detect_disks()
+    io_executor.shutdown()
+    io_executor = ThreadPoolExecutor(max_workers=len(DISKS_TO_MONITOR) + 2)
+
     # Initial call to set baseline for CPU and network
-    psutil.cpu_percent(interval=0.1)  # Establishes a baseline for subsequent non-blocking cpu_percent calls
+    get_cpu_usage()  # Establishes a baseline for subsequent non-blocking CPU usage calls
     get_network_speed()  # Initial call for network
     time.sleep(0.1)  # Small delay
 
     try:
-        while True:
-            clear_screen()
-            display_system_stats()
-            print(f"\nUpdating in {UPDATE_INTERVAL} seconds...")
-            time.sleep(UPDATE_INTERVAL)
+        asyncio.run(monitor(args.refresh_partitions_every if auto_detect_disks else 0))
     except KeyboardInterrupt:
         clear_screen()
         print("System monitor stopped by user.")